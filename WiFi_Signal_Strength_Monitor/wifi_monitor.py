@@ -5,39 +5,105 @@ Author: Bernardo Gallegos Vallejo
 Description: Monitors WiFi signal strength across different operating systems
 """
 
+import atexit
 import subprocess
+import threading
 import time
 import re
 import datetime
 import csv
-import os
 import platform
 import sys
 
+import numpy as np
+
+# Threshold tables for branchless classification: a searchsorted lookup
+# replaces the if/elif ladders and vectorizes over whole log columns too
+_QUALITY_THRESH = np.array([-80, -70, -67, -30])
+_QUALITY_LEVELS = np.array([0, 25, 50, 75, 100])
+_STATUS_THRESH = np.array([-70, -60, -50])
+_STATUS_LABELS = ("Poor", "Fair", "Good", "Excellent")
+
 class WiFiMonitor:
+    # Patterns compiled once at class level instead of per poll
+    _MACOS_SSID_RE = re.compile(r'SSID: (.+)')
+    _MACOS_RSSI_RE = re.compile(r'agrCtlRSSI: (-?\d+)')
+    _MACOS_CHANNEL_RE = re.compile(r'channel: (\d+)')
+    _MACOS_PROFILER_SSID_RE = re.compile(r'Current Network Information:\s+(.+?):')
+    _MACOS_PROFILER_SIGNAL_RE = re.compile(r'Signal / Noise: (-?\d+) dBm')
+    _WINDOWS_SSID_RE = re.compile(r'SSID\s+: (.+)')
+    _WINDOWS_SIGNAL_RE = re.compile(r'Signal\s+: (\d+)%')
+    _WINDOWS_CHANNEL_RE = re.compile(r'Channel\s+: (\d+)')
+
     def __init__(self):
         self.log_file = "wifi_signal_log.csv"
         self.os_type = platform.system()
         self.setup_log_file()
-    
+
+        # Cache parsed results briefly so tight polling loops don't pay a
+        # fork+exec (tens of ms) for every sample
+        self._cached_info = None
+        self._cache_time = 0.0
+        self.cache_ttl = 1.0  # seconds
+        self._event_proc = None
+        self._start_event_monitor()
+
+    def _start_event_monitor(self):
+        """Stream NetworkManager events instead of re-polling blindly
+
+        On Linux, a single long-running 'nmcli monitor' process tells us
+        when the connection actually changes; any event just invalidates
+        the cache so the next poll re-queries.
+        """
+        if self.os_type != "Linux":
+            return
+        try:
+            self._event_proc = subprocess.Popen(
+                ['nmcli', '--terse', 'monitor'],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        except (FileNotFoundError, OSError):
+            return
+
+        def watch():
+            for _ in self._event_proc.stdout:
+                self._cache_time = 0.0  # invalidate cache on any event
+
+        threading.Thread(target=watch, daemon=True).start()
+
     def setup_log_file(self):
-        """Initialize CSV log file with headers"""
-        if not os.path.exists(self.log_file):
-            with open(self.log_file, 'w', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow(['Timestamp', 'SSID', 'Signal_Strength_dBm', 'Quality_Percent', 'Channel', 'Frequency_MHz'])
+        """Initialize CSV log file and keep the handle open for appends"""
+        # Exclusive-create writes the header atomically - no exists/open
+        # race when several monitor instances share a log directory
+        try:
+            with open(self.log_file, 'x', newline='') as file:
+                csv.writer(file).writerow(['Timestamp', 'SSID', 'Signal_Strength_dBm', 'Quality_Percent', 'Channel', 'Frequency_MHz'])
+        except FileExistsError:
+            pass
+        # One open() for the whole session instead of one per sample
+        self._log_fh = open(self.log_file, 'a', newline='', buffering=8192)
+        self._writes_since_flush = 0
+        atexit.register(self._log_fh.close)
     
     def get_wifi_info(self):
         """Get WiFi information based on operating system"""
+        now = time.monotonic()
+        if self._cached_info is not None and now - self._cache_time < self.cache_ttl:
+            return self._cached_info
+
         if self.os_type == "Darwin":  # macOS
-            return self.get_wifi_info_macos()
+            info = self.get_wifi_info_macos()
         elif self.os_type == "Linux":
-            return self.get_wifi_info_linux()
+            info = self.get_wifi_info_linux()
         elif self.os_type == "Windows":
-            return self.get_wifi_info_windows()
+            info = self.get_wifi_info_windows()
         else:
             print(f"Unsupported operating system: {self.os_type}")
             return None
+
+        if info is not None:
+            self._cached_info = info
+            self._cache_time = now
+        return info
     
     def get_wifi_info_macos(self):
         """Get WiFi information on macOS using airport utility"""
@@ -50,9 +116,9 @@ class WiFiMonitor:
             output = result.stdout
             
             # Parse the output
-            ssid_match = re.search(r'SSID: (.+)', output)
-            signal_match = re.search(r'agrCtlRSSI: (-?\d+)', output)
-            channel_match = re.search(r'channel: (\d+)', output)
+            ssid_match = self._MACOS_SSID_RE.search(output)
+            signal_match = self._MACOS_RSSI_RE.search(output)
+            channel_match = self._MACOS_CHANNEL_RE.search(output)
             
             ssid = ssid_match.group(1).strip() if ssid_match else "Unknown"
             signal_strength = int(signal_match.group(1)) if signal_match else 0
@@ -81,8 +147,8 @@ class WiFiMonitor:
                 output = result.stdout
                 
                 # Basic parsing for system_profiler output
-                ssid_match = re.search(r'Current Network Information:\s+(.+?):', output)
-                signal_match = re.search(r'Signal / Noise: (-?\d+) dBm', output)
+                ssid_match = self._MACOS_PROFILER_SSID_RE.search(output)
+                signal_match = self._MACOS_PROFILER_SIGNAL_RE.search(output)
                 
                 ssid = ssid_match.group(1).strip() if ssid_match else "Unknown"
                 signal_strength = int(signal_match.group(1)) if signal_match else -70
@@ -141,9 +207,9 @@ class WiFiMonitor:
                                   capture_output=True, text=True)
             output = result.stdout
             
-            ssid_match = re.search(r'SSID\s+: (.+)', output)
-            signal_match = re.search(r'Signal\s+: (\d+)%', output)
-            channel_match = re.search(r'Channel\s+: (\d+)', output)
+            ssid_match = self._WINDOWS_SSID_RE.search(output)
+            signal_match = self._WINDOWS_SIGNAL_RE.search(output)
+            channel_match = self._WINDOWS_CHANNEL_RE.search(output)
             
             ssid = ssid_match.group(1).strip() if ssid_match else "Unknown"
             signal_percent = int(signal_match.group(1)) if signal_match else 0
@@ -164,31 +230,28 @@ class WiFiMonitor:
             return None
     
     def calculate_quality_from_signal(self, signal_dbm):
-        """Calculate quality percentage from signal strength"""
-        if signal_dbm >= -30:
-            return 100
-        elif signal_dbm >= -67:
-            return 75
-        elif signal_dbm >= -70:
-            return 50
-        elif signal_dbm >= -80:
-            return 25
-        else:
-            return 0
+        """Calculate quality percentage from signal strength
+
+        Accepts a scalar or an array of dBm values; bulk post-processing
+        of a logged column goes through the same lookup.
+        """
+        quality = _QUALITY_LEVELS[np.searchsorted(_QUALITY_THRESH, signal_dbm, side='right')]
+        return int(quality) if np.isscalar(signal_dbm) else quality
     
     def log_data(self, wifi_info):
         """Log WiFi data to CSV file"""
         timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        with open(self.log_file, 'a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow([
-                timestamp,
-                wifi_info['ssid'],
-                wifi_info['signal_strength'],
-                wifi_info['quality'],
-                wifi_info['channel'],
-                wifi_info['frequency']
-            ])
+        # Fixed schema, so one C-level format beats csv.writer's per-field
+        # stringification; commas in SSIDs are mapped to ';' to keep the
+        # row intact
+        self._log_fh.write(
+            f"{timestamp},{wifi_info['ssid'].replace(',', ';')},"
+            f"{wifi_info['signal_strength']},{wifi_info['quality']},"
+            f"{wifi_info['channel']},{wifi_info['frequency']}\n")
+        self._writes_since_flush += 1
+        if self._writes_since_flush >= 10:
+            self._log_fh.flush()
+            self._writes_since_flush = 0
     
     def display_info(self, wifi_info):
         """Display WiFi information in a formatted way"""
@@ -206,15 +269,8 @@ class WiFiMonitor:
             print(f"Frequency: {wifi_info['frequency']} MHz")
         
         # Signal strength indicator
-        if wifi_info['signal_strength'] >= -50:
-            status = "Excellent"
-        elif wifi_info['signal_strength'] >= -60:
-            status = "Good"
-        elif wifi_info['signal_strength'] >= -70:
-            status = "Fair"
-        else:
-            status = "Poor"
-        
+        status = _STATUS_LABELS[np.searchsorted(_STATUS_THRESH, wifi_info['signal_strength'], side='right')]
+
         print(f"Connection Status: {status}")
     
     def monitor(self, interval=5):
@@ -224,6 +280,10 @@ class WiFiMonitor:
         print("Press Ctrl+C to stop monitoring\n")
         
         try:
+            # Schedule against a monotonic clock so per-cycle work doesn't
+            # accumulate drift - keeps log samples evenly spaced over hours
+            start = time.monotonic()
+            cycle = 0
             while True:
                 wifi_info = self.get_wifi_info()
                 if wifi_info:
@@ -232,11 +292,18 @@ class WiFiMonitor:
                 else:
                     print("Unable to retrieve WiFi information")
                     print("Note: On macOS, you may need to run with sudo or check WiFi is enabled")
-                
-                time.sleep(interval)
+
+                cycle += 1
+                remaining = start + cycle * interval - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
         except KeyboardInterrupt:
             print("\n\nMonitoring stopped by user")
             print(f"Log saved to: {self.log_file}")
+        finally:
+            self._log_fh.flush()
+            if self._event_proc is not None:
+                self._event_proc.terminate()
 
 if __name__ == "__main__":
     monitor = WiFiMonitor()
@@ -5,18 +5,109 @@ Author: Bernardo Gallegos Vallejo
 Description: Simulates WiFi environments to demonstrate understanding of wireless concepts
 """
 
-import random
+import atexit
+import queue
+import sys
+import threading
 import time
 import datetime
 import csv
 import os
 import math
+from dataclasses import dataclass
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional - fall back to the plain Python/NumPy version
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Interference classification by SNR bucket: [<20, 20-30, >=30] dB
+_INTERFERENCE_LABELS = np.array(['High', 'Medium', 'Low'])
+_SNR_BUCKETS = np.array([20, 30])
+
+# Channel -> frequency (MHz) lookup table, built once at import; whole
+# channel arrays can be translated with a single fancy-index
+CH2FREQ = np.full(200, -1, dtype=np.int16)
+for _ch in range(1, 15):  # 2.4 GHz band
+    CH2FREQ[_ch] = 2412 + (_ch - 1) * 5
+for _ch in range(36, 181):  # 5 GHz band
+    CH2FREQ[_ch] = 5180 + (_ch - 36) * 5
+del _ch
+
+# Column layout of the per-tick analysis recarray
+_RESULT_DTYPE = np.dtype([
+    ('ssid', 'U20'),
+    ('bssid', 'U17'),
+    ('signal_strength', 'f8'),
+    ('noise_floor', 'i2'),
+    ('snr', 'f8'),
+    ('channel', 'i2'),
+    ('frequency', 'i2'),
+    ('utilization', 'i2'),
+    ('clients', 'i2'),
+    ('interference', 'U6')
+])
+
+
+@njit(cache=True, fastmath=True)
+def _compute_tick(base_signals, interference, fluctuation, noise_jitter,
+                  util_jitter, distance_factor, base_utilization):
+    """Numeric kernel for one simulation tick
+
+    Pure arithmetic over pre-drawn random arrays (all float64), compiled
+    by Numba when available. Returns (signal, noise_floor, snr,
+    utilization) arrays.
+    """
+    signal = base_signals - interference + fluctuation + distance_factor
+    noise_floor = -95.0 + noise_jitter
+    snr = signal - noise_floor
+    utilization = np.minimum(np.maximum(base_utilization + util_jitter, 0.0), 100.0)
+    return signal, noise_floor, snr, utilization
+
+
+@dataclass
+class AccessPointArrays:
+    """Struct-of-arrays store for the simulated access points
+
+    One NumPy column per numeric field so the per-tick analysis runs as
+    a handful of vectorized operations instead of per-AP Python math.
+    """
+    ssids: list
+    bssids: list
+    channels: np.ndarray
+    frequencies: np.ndarray
+    base_signals: np.ndarray
+    clients: np.ndarray
+
+    def __len__(self):
+        return len(self.channels)
+
 
 class WiFiSimulator:
     def __init__(self):
         self.log_file = "wifi_analysis_log.csv"
         self.setup_log_file()
-        
+        # The schema is fixed and the generated fields never need quoting,
+        # so rows are pre-encoded to bytes and appended through a raw fd -
+        # one write syscall per tick instead of csv.writer's per-field
+        # formatting and per-row buffered writes
+        self._log_fd = os.open(self.log_file,
+                               os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        atexit.register(os.close, self._log_fd)
+
+        # Writes happen on a background thread so the next analysis tick
+        # is never blocked waiting on the filesystem
+        self._log_queue = queue.Queue()
+        self._log_thread = threading.Thread(target=self._log_worker, daemon=True)
+        self._log_thread.start()
+        atexit.register(self._shutdown_logging)
+
         # Simulate different WiFi environments
         self.environments = {
             "Office": {
@@ -39,9 +130,44 @@ class WiFiSimulator:
             }
         }
         
-        self.current_environment = "Office"
+        # Precompute a 24-slot boolean mask per environment so peak-hour
+        # membership is an O(1) index instead of a list scan
+        for env in self.environments.values():
+            peak_mask = np.zeros(24, dtype=bool)
+            peak_mask[env["peak_hours"]] = True
+            env["peak_mask"] = peak_mask
+
+        self._rng = np.random.default_rng()
+        # Skip the formatted per-tick display when nobody is watching
+        # (cron runs, piped output) - the CSV log still captures everything
+        self._interactive = sys.stdout.isatty()
+        self.set_environment("Office")
         self.access_points = self.generate_access_points()
-    
+
+    def set_environment(self, name):
+        """Switch the simulated environment
+
+        Environment switches are rare, so the env dict is resolved here
+        once and kept in _active_env rather than looked up per tick (and
+        per AP) in the hot paths.
+        """
+        self.current_environment = name
+        self._active_env = self.environments[name]
+
+    def _log_worker(self):
+        """Drain queued tick buffers to the CSV file until shutdown"""
+        while True:
+            buf = self._log_queue.get()
+            if buf is None:
+                break
+            os.write(self._log_fd, buf)
+
+    def _shutdown_logging(self):
+        """Stop the writer thread once its queue is drained"""
+        if self._log_thread.is_alive():
+            self._log_queue.put(None)
+            self._log_thread.join(timeout=5)
+
     def setup_log_file(self):
         """Initialize CSV log file with headers"""
         if not os.path.exists(self.log_file):
@@ -56,127 +182,160 @@ class WiFiSimulator:
     
     def generate_access_points(self):
         """Generate realistic access points for the environment"""
-        aps = []
-        env = self.environments[self.current_environment]
-        
-        # Generate multiple APs as would be in a real environment
-        num_aps = random.randint(3, 8)
-        for i in range(num_aps):
-            channel = random.choice(env["channel_congestion"])
-            aps.append({
-                "ssid": f"Corp-WiFi-{i+1}" if self.current_environment != "Warehouse" 
-                        else f"WH-Scanner-{i+1}",
-                "bssid": f"AA:BB:CC:DD:{i:02X}:{random.randint(0,255):02X}",
-                "channel": channel,
-                "frequency": self.channel_to_frequency(channel),
-                "base_signal": env["base_signal"] + random.randint(-10, 5),
-                "clients": random.randint(10, 50)
-            })
-        return aps
+        env = self._active_env
+
+        rng = self._rng
+
+        # Generate multiple APs as would be in a real environment; each
+        # numeric column comes from one batched draw on the instance
+        # generator instead of several stdlib random calls per AP
+        num_aps = int(rng.integers(3, 9))
+        prefix = ("Corp-WiFi" if self.current_environment != "Warehouse"
+                  else "WH-Scanner")
+
+        channels = rng.choice(env["channel_congestion"], num_aps).astype(np.int16)
+        frequencies = CH2FREQ[channels]
+        base_signals = env["base_signal"] + rng.integers(-10, 6, num_aps).astype(np.float64)
+        clients = rng.integers(10, 51, num_aps).astype(np.int32)
+        bssid_octets = rng.integers(0, 256, num_aps)
+
+        ssids = [f"{prefix}-{i+1}" for i in range(num_aps)]
+        bssids = [f"AA:BB:CC:DD:{i:02X}:{octet:02X}"
+                  for i, octet in enumerate(bssid_octets)]
+
+        return AccessPointArrays(ssids, bssids, channels, frequencies,
+                                 base_signals, clients)
+
+    def regenerate_access_points_inplace(self):
+        """Re-roll the AP population without reallocating the columns
+
+        Regeneration keeps the same AP count, so the existing SoA buffers
+        are overwritten with fresh batched draws - no new arrays and no
+        per-AP dict churn. Only the bssid strings are rebuilt.
+        """
+        aps = self.access_points
+        env = self._active_env
+        rng = self._rng
+        n = len(aps)
+
+        aps.channels[:] = rng.choice(env["channel_congestion"], n)
+        aps.frequencies[:] = CH2FREQ[aps.channels]
+        aps.base_signals[:] = env["base_signal"] + rng.integers(-10, 6, n)
+        aps.clients[:] = rng.integers(10, 51, n)
+        aps.bssids[:] = [f"AA:BB:CC:DD:{i:02X}:{octet:02X}"
+                         for i, octet in enumerate(rng.integers(0, 256, n))]
     
     def channel_to_frequency(self, channel):
         """Convert channel number to frequency"""
-        if channel <= 14:  # 2.4 GHz band
-            return 2412 + (channel - 1) * 5
-        else:  # 5 GHz band
-            return 5180 + (channel - 36) * 5
-    
-    def calculate_signal_with_interference(self, base_signal, hour):
-        """Calculate signal strength with time-based interference"""
-        env = self.environments[self.current_environment]
-        
-        # Add interference during peak hours
-        interference = 0
-        if hour in env["peak_hours"]:
-            interference = random.randint(0, env["interference"])
-        
-        # Add random fluctuation
-        fluctuation = random.uniform(-3, 3)
-        
-        # Add distance simulation (people/equipment moving)
-        distance_factor = math.sin(time.time() / 10) * 5
-        
-        return base_signal - interference + fluctuation + distance_factor
+        return int(CH2FREQ[channel])
     
+    def _draw_tick_arrays(self, n, is_peak, env_interference):
+        """Batch-draw the random inputs the tick kernel consumes"""
+        rng = self._rng
+        if is_peak and env_interference > 0:
+            interference = rng.integers(0, env_interference + 1, n).astype(np.float64)
+        else:
+            interference = np.zeros(n)
+        fluctuation = rng.uniform(-3, 3, n)
+        noise_jitter = rng.integers(-2, 3, n).astype(np.float64)
+        util_jitter = rng.integers(-10, 21, n).astype(np.float64)
+        return interference, fluctuation, noise_jitter, util_jitter
+
+    @staticmethod
+    def _distance_factor():
+        """Slow sinusoidal drift shared by every AP in a tick
+
+        The value moves on a ~60 s period, so it is computed once per
+        tick and broadcast into the kernel rather than re-derived (with
+        a clock_gettime call) per AP.
+        """
+        return math.sin(time.time() / 10) * 5
+
+    def calculate_signal_with_interference(self, base_signal, hour,
+                                           distance_factor=None):
+        """Calculate signal strength with time-based interference
+
+        Callers iterating several APs in one tick should pass the shared
+        distance_factor from _distance_factor() instead of letting each
+        call recompute it.
+        """
+        env = self._active_env
+        is_peak = bool(env["peak_mask"][hour])
+        inputs = self._draw_tick_arrays(1, is_peak, env["interference"])
+        if distance_factor is None:
+            distance_factor = self._distance_factor()
+        signal, _, _, _ = _compute_tick(
+            np.array([float(base_signal)]), *inputs[:3], inputs[3],
+            distance_factor, 20.0)
+        return float(signal[0])
+
     def calculate_channel_utilization(self, channel, hour):
         """Calculate channel utilization percentage"""
-        base_utilization = 20
-        
-        # Higher utilization during peak hours
-        env = self.environments[self.current_environment]
-        if hour in env["peak_hours"]:
-            base_utilization += 30
-        
-        # Add random variation
-        utilization = base_utilization + random.randint(-10, 20)
-        
-        # Ensure within valid range
-        return max(0, min(100, utilization))
-    
+        env = self._active_env
+        base_utilization = 50.0 if env["peak_mask"][hour] else 20.0
+        inputs = self._draw_tick_arrays(1, False, 0)
+        _, _, _, utilization = _compute_tick(
+            np.zeros(1), *inputs[:3], inputs[3], 0.0, base_utilization)
+        return int(utilization[0])
+
     def calculate_snr(self, signal_strength):
         """Calculate Signal-to-Noise Ratio"""
-        noise_floor = -95 + random.randint(-2, 2)  # Typical noise floor
+        noise_floor = -95 + int(self._rng.integers(-2, 3))  # Typical noise floor
         snr = signal_strength - noise_floor
         return signal_strength, noise_floor, snr
     
     def analyze_environment(self):
-        """Analyze current WiFi environment"""
+        """Analyze current WiFi environment
+
+        All per-AP math runs as whole-column NumPy operations over the
+        struct-of-arrays AP store; one batched RNG draw per quantity
+        replaces four stdlib random calls per AP.
+        """
         current_hour = datetime.datetime.now().hour
-        results = []
-        
-        for ap in self.access_points:
-            signal = self.calculate_signal_with_interference(
-                ap["base_signal"], current_hour
-            )
-            signal_dbm, noise_floor, snr = self.calculate_snr(signal)
-            
-            utilization = self.calculate_channel_utilization(
-                ap["channel"], current_hour
-            )
-            
-            # Determine interference level
-            if snr < 20:
-                interference = "High"
-            elif snr < 30:
-                interference = "Medium"
-            else:
-                interference = "Low"
-            
-            results.append({
-                'ssid': ap["ssid"],
-                'bssid': ap["bssid"],
-                'signal_strength': round(signal_dbm, 1),
-                'noise_floor': noise_floor,
-                'snr': round(snr, 1),
-                'channel': ap["channel"],
-                'frequency': ap["frequency"],
-                'utilization': utilization,
-                'clients': ap["clients"] + random.randint(-5, 5),
-                'interference': interference
-            })
-        
-        return results
+        aps = self.access_points
+        n = len(aps)
+        env = self._active_env
+        rng = self._rng
+        is_peak = bool(env["peak_mask"][current_hour])
+
+        # One batched RNG draw per quantity, then the compiled kernel does
+        # the signal/noise/SNR/utilization arithmetic in a single pass
+        inputs = self._draw_tick_arrays(n, is_peak, env["interference"])
+        distance_factor = self._distance_factor()  # same for every AP
+        base_utilization = 50.0 if is_peak else 20.0
+        signal, noise_floor, snr, utilization = _compute_tick(
+            aps.base_signals, *inputs[:3], inputs[3],
+            distance_factor, base_utilization)
+
+        interference_level = _INTERFERENCE_LABELS[np.digitize(snr, _SNR_BUCKETS)]
+        clients = aps.clients + rng.integers(-5, 6, n)
+
+        # Round in place - the kernel outputs are tick-local scratch, so
+        # there is no reason to allocate fresh rounded copies
+        np.round(signal, 1, out=signal)
+        np.round(snr, 1, out=snr)
+
+        # Keep the struct-of-arrays layout all the way out: one recarray
+        # instead of N dicts, so display/log aggregation stays columnar
+        return np.rec.fromarrays(
+            [aps.ssids, aps.bssids, signal, noise_floor, snr,
+             aps.channels, aps.frequencies, utilization, clients,
+             interference_level],
+            dtype=_RESULT_DTYPE)
     
     def log_data(self, ap_data):
         """Log WiFi data to CSV file"""
         timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        with open(self.log_file, 'a', newline='') as file:
-            writer = csv.writer(file)
-            for ap in ap_data:
-                writer.writerow([
-                    timestamp,
-                    self.current_environment,
-                    ap['ssid'],
-                    ap['bssid'],
-                    ap['signal_strength'],
-                    ap['noise_floor'],
-                    ap['snr'],
-                    ap['channel'],
-                    ap['frequency'],
-                    ap['utilization'],
-                    ap['clients'],
-                    ap['interference']
-                ])
+        # recarray.tolist() yields plain Python tuples in column order,
+        # which matches the CSV schema after the two context fields; the
+        # whole tick is encoded into one bytes blob up front
+        prefix = f"{timestamp},{self.current_environment},"
+        buf = b"".join(
+            (prefix + ",".join(map(str, row)) + "\n").encode()
+            for row in ap_data.tolist())
+        # Hand the buffer to the writer thread; the tick continues while
+        # the previous one is still being written
+        self._log_queue.put(buf)
     
     def display_analysis(self, ap_data):
         """Display WiFi analysis in a formatted way"""
@@ -185,39 +344,43 @@ class WiFiSimulator:
         print(f"Environment: {self.current_environment}")
         print("="*80)
         
-        # Sort by signal strength
-        ap_data.sort(key=lambda x: x['signal_strength'], reverse=True)
-        
+        # Only the strongest 5 are printed, so an O(N) partition finds
+        # them without fully sorting the survey; just those 5 get ordered
+        signal = ap_data.signal_strength
+        top = min(5, len(ap_data))
+        idx = np.argpartition(signal, -top)[-top:]
+        idx = idx[np.argsort(-signal[idx])]
+
         print(f"{'SSID':<20} {'Signal':<8} {'SNR':<8} {'Ch':<4} {'Util%':<7} {'Clients':<8} {'Interference'}")
         print("-"*80)
-        
-        for ap in ap_data[:5]:  # Show top 5 APs
-            print(f"{ap['ssid']:<20} "
-                  f"{ap['signal_strength']:<8.1f} "
-                  f"{ap['snr']:<8.1f} "
-                  f"{ap['channel']:<4} "
-                  f"{ap['utilization']:<7} "
-                  f"{ap['clients']:<8} "
-                  f"{ap['interference']}")
-        
-        # Channel analysis
+
+        # One preparsed %-format per row, one write for the whole block
+        # instead of a print (and flush) per AP
+        row_fmt = "%-20s %-8.1f %-8.1f %-4d %-7d %-8d %s"
+        sys.stdout.write("\n".join(
+            row_fmt % (ap['ssid'], ap['signal_strength'], ap['snr'],
+                       ap['channel'], ap['utilization'], ap['clients'],
+                       ap['interference'])
+            for ap in ap_data[idx]) + "\n")
+
+        # Channel analysis: bincount is a single pass with no hashing or
+        # sort, and its indices are naturally ordered by channel
         print("\nChannel Congestion Analysis:")
-        channel_counts = {}
-        for ap in ap_data:
-            ch = ap['channel']
-            channel_counts[ch] = channel_counts.get(ch, 0) + 1
-        
-        for ch, count in sorted(channel_counts.items()):
-            print(f"  Channel {ch}: {count} APs detected")
-        
+        counts = np.bincount(ap_data.channel, minlength=200)
+        channels = np.nonzero(counts)[0]
+
+        sys.stdout.write("".join(
+            f"  Channel {ch}: {counts[ch]} APs detected\n"
+            for ch in channels))
+
         # Recommendations
         print("\nRecommendations:")
-        high_interference = [ap for ap in ap_data if ap['interference'] == 'High']
+        high_interference = int((ap_data.interference == 'High').sum())
         if high_interference:
-            print(f"  - {len(high_interference)} APs showing high interference")
+            print(f"  - {high_interference} APs showing high interference")
             print("  - Consider channel reassignment or power adjustment")
-        
-        congested_channels = [ch for ch, count in channel_counts.items() if count > 2]
+
+        congested_channels = np.nonzero(counts > 2)[0].tolist()
         if congested_channels:
             print(f"  - Channels {congested_channels} are congested")
             print("  - Consider using DFS channels or 5GHz band")
@@ -239,15 +402,16 @@ class WiFiSimulator:
             while True:
                 # Analyze current environment
                 ap_data = self.analyze_environment()
-                self.display_analysis(ap_data)
+                if self._interactive:
+                    self.display_analysis(ap_data)
                 self.log_data(ap_data)
                 
                 # Wait for next iteration
                 time.sleep(10)
                 
                 # Occasionally regenerate APs (simulating movement/changes)
-                if random.random() < 0.1:
-                    self.access_points = self.generate_access_points()
+                if self._rng.random() < 0.1:
+                    self.regenerate_access_points_inplace()
                 
         except KeyboardInterrupt:
             print("\n\nSimulation stopped by user")
@@ -257,7 +421,18 @@ class WiFiSimulator:
             print("- Channel utilization and interference")
             print("- Time-based network patterns")
             print("- Multi-AP environment analysis")
+        finally:
+            self._shutdown_logging()
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="WiFi environment simulator")
+    parser.add_argument('--quiet', action='store_true',
+                        help="suppress per-tick display even on a terminal")
+    args = parser.parse_args()
+
     simulator = WiFiSimulator()
+    if args.quiet:
+        simulator._interactive = False
     simulator.simulate()
\ No newline at end of file
@@ -5,10 +5,11 @@ Author: Bernardo Gallegos Vallejo
 Description: Generates visual troubleshooting flowcharts for wireless issues
 """
 
-def generate_connectivity_flowchart():
-    """Generate ASCII flowchart for connectivity troubleshooting"""
-    
-    flowchart = """
+from pathlib import Path
+
+# The flowcharts are static ASCII art; build each string once at module
+# load instead of re-creating it on every call
+CONNECTIVITY_FLOWCHART = """
     WIRELESS CONNECTIVITY TROUBLESHOOTING FLOWCHART
     ==============================================
     
@@ -47,13 +48,8 @@ def generate_connectivity_flowchart():
     3. DHCP Issues: Ensure VLAN has DHCP scope with available addresses
     4. SSID Issues: Confirm SSID is broadcasting and spelled correctly
     """
-    
-    return flowchart
 
-def generate_performance_flowchart():
-    """Generate ASCII flowchart for performance troubleshooting"""
-    
-    flowchart = """
+PERFORMANCE_FLOWCHART = """
     WIRELESS PERFORMANCE TROUBLESHOOTING FLOWCHART
     =============================================
     
@@ -92,13 +88,8 @@ def generate_performance_flowchart():
     - Retry Rate: < 10% (< 5% ideal)
     - Clients per AP: < 30 for scanners, < 50 for IoT
     """
-    
-    return flowchart
 
-def generate_roaming_flowchart():
-    """Generate ASCII flowchart for roaming troubleshooting"""
-    
-    flowchart = """
+ROAMING_FLOWCHART = """
     WIRELESS ROAMING TROUBLESHOOTING FLOWCHART
     =========================================
     
@@ -142,20 +133,31 @@ def generate_roaming_flowchart():
     - Enable all: 802.11k + v + r
     - Same VLAN across APs for L2 roaming
     """
-    
-    return flowchart
+
+_FLOWCHARTS = {
+    "connectivity_flowchart.txt": CONNECTIVITY_FLOWCHART,
+    "performance_flowchart.txt": PERFORMANCE_FLOWCHART,
+    "roaming_flowchart.txt": ROAMING_FLOWCHART
+}
+
+def generate_connectivity_flowchart():
+    """Generate ASCII flowchart for connectivity troubleshooting"""
+    return CONNECTIVITY_FLOWCHART
+
+def generate_performance_flowchart():
+    """Generate ASCII flowchart for performance troubleshooting"""
+    return PERFORMANCE_FLOWCHART
+
+def generate_roaming_flowchart():
+    """Generate ASCII flowchart for roaming troubleshooting"""
+    return ROAMING_FLOWCHART
 
 def save_flowcharts():
     """Save all flowcharts to files"""
-    flowcharts = {
-        "connectivity_flowchart.txt": generate_connectivity_flowchart(),
-        "performance_flowchart.txt": generate_performance_flowchart(),
-        "roaming_flowchart.txt": generate_roaming_flowchart()
-    }
-    
-    for filename, content in flowcharts.items():
-        with open(filename, 'w') as f:
-            f.write(content)
+    # write_text opens, writes and closes in one call per file - less
+    # file-object churn than building a writer per flowchart
+    for filename, content in _FLOWCHARTS.items():
+        Path(filename).write_text(content)
         print(f"Saved: {filename}")
 
 if __name__ == "__main__":